@@ -152,20 +152,32 @@ RETURNS TABLE (
     vector_rank INTEGER,
     fts_rank INTEGER
 ) AS $$
-WITH vector_search AS (
+-- The vector CTE must ORDER BY the raw distance operator (no JOIN, no window
+-- function) so the planner can walk idx_chunks_embedding instead of doing a
+-- sequential scan + top-N sort. Ranks are assigned after the LIMIT.
+WITH vector_candidates AS (
     SELECT 
         c.id,
         c.document_id,
         c.content,
-        1 - (c.embedding <=> p_embedding) as similarity,
-        ROW_NUMBER() OVER (ORDER BY c.embedding <=> p_embedding) as rank
+        c.embedding <=> p_embedding as distance
     FROM chunks c
-    JOIN documents d ON c.document_id = d.id
     WHERE c.project_id = p_project_id
-      AND (p_category IS NULL OR d.category = p_category)
+      AND (p_category IS NULL OR EXISTS (
+          SELECT 1 FROM documents d
+          WHERE d.id = c.document_id AND d.category = p_category
+      ))
     ORDER BY c.embedding <=> p_embedding
     LIMIT p_limit * 2
 ),
+vector_search AS (
+    SELECT 
+        id,
+        document_id,
+        content,
+        ROW_NUMBER() OVER (ORDER BY distance) as rank
+    FROM vector_candidates
+),
 fts_search AS (
     SELECT 
         c.id,
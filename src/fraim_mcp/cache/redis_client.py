@@ -2,14 +2,17 @@
 
 Cache key format: fraim:{project_id}:v{corpus_version}:search:{query_hash}
 
+The query hash is xxh3_64: keys are not security-sensitive, so a fast
+non-cryptographic hash is used instead of SHA-256.
+
 CRITICAL: Use redis.asyncio (not aioredis or sync redis).
 """
 
-import hashlib
 import json
 from typing import Any
 
 import redis.asyncio as redis
+import xxhash
 
 from fraim_mcp.config import get_settings
 
@@ -18,15 +21,21 @@ def generate_cache_key(
     project_id: str,
     corpus_version: int,
     query: str,
+    top_k: int = 5,
+    category: str | None = None,
+    use_reranker: bool = True,
 ) -> str:
     """Generate a cache key for a search query.
     
     Format: fraim:{project_id}:v{corpus_version}:search:{query_hash}
     
     The corpus_version ensures cache invalidation when documents change.
+    top_k, category and use_reranker change the result set, so they are
+    hashed with the query. Defaults match SearchRequest.
     """
-    # Hash the query for consistent key length
-    query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+    # Hash the request for consistent key length (xxh3_64 -> 16 hex chars)
+    fingerprint = f"{query}\x1f{top_k}\x1f{category or ''}\x1f{int(use_reranker)}"
+    query_hash = xxhash.xxh3_64_hexdigest(fingerprint)
     
     return f"fraim:{project_id}:v{corpus_version}:search:{query_hash}"
 
@@ -146,12 +155,17 @@ class CacheClient:
             return False
         
         try:
+            # UNLINK rather than DEL: Redis reclaims the memory in a
+            # background thread, so large cached responses never block it
             if "*" in key:
-                # Pattern delete
-                async for k in self._client.scan_iter(match=key):
-                    await self._client.delete(k)
+                # Pattern delete: buffer every UNLINK in one pipeline so the
+                # whole invalidation is a single round trip, not one per key
+                async with self._client.pipeline(transaction=False) as pipe:
+                    async for k in self._client.scan_iter(match=key):
+                        pipe.unlink(k)
+                    await pipe.execute()
             else:
-                await self._client.delete(key)
+                await self._client.unlink(key)
             return True
         except Exception:
             return False
@@ -24,6 +24,7 @@ class Settings(BaseSettings):
         env_file=None,  # No .env files - use Doppler
         case_sensitive=False,
         extra="ignore",
+        frozen=True,  # get_settings() shares one instance process-wide
     )
     
     # Database
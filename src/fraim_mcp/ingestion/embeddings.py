@@ -95,13 +95,13 @@ class EmbeddingClient:
         return embedding
     
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for multiple texts.
+        """Generate embeddings for multiple texts in one API request.
         
         Args:
             texts: List of texts to embed
         
         Returns:
-            List of embeddings, each with 1024 floats
+            List of embeddings in input order, each with 1024 floats
         """
         if not texts:
             return []
@@ -113,7 +113,13 @@ class EmbeddingClient:
             dimensions=self._dimension,
         )
         
-        embeddings = [item["embedding"] for item in response.data]
+        # Providers tag each item with its input index; don't rely on order
+        data = sorted(response.data, key=lambda item: item.get("index", 0))
+        embeddings = [item["embedding"] for item in data]
+        
+        if len(embeddings) != len(texts):
+            # Partial batch response - fall back to one request per text
+            embeddings = list(await asyncio.gather(*(self.embed(t) for t in texts)))
         
         # Validate all dimensions
         for i, emb in enumerate(embeddings):
@@ -4,12 +4,66 @@ Logfire provides:
 - OpenTelemetry-based tracing
 - Auto-instrumentation for FastAPI, asyncpg, Redis, httpx
 - Cost tracking for LLM calls
+
+Under pytest (or FRAIM_OBS_MODE=test) spans go to an in-memory exporter
+instead of Logfire, so tests pay no network cost and leave no exporter
+threads running. Use get_test_span_exporter() to inspect or clear them.
 """
 
 import os
 from typing import Any
 
 _configured = False
+_test_exporter: Any = None
+
+
+def _is_test_mode() -> bool:
+    """Check whether we are running under pytest or explicit test mode."""
+    return (
+        os.environ.get("FRAIM_OBS_MODE") == "test"
+        or "PYTEST_CURRENT_TEST" in os.environ
+    )
+
+
+def get_test_span_exporter() -> Any:
+    """Return the in-memory span exporter, or None outside test mode."""
+    return _test_exporter
+
+
+def _instrument_libraries(logfire: Any) -> None:
+    """Auto-instrument common libraries."""
+    logfire.instrument_asyncpg()
+    logfire.instrument_redis()
+    logfire.instrument_httpx()
+
+
+def _setup_test_observability() -> dict[str, Any]:
+    """Configure Logfire with an in-memory exporter (no network)."""
+    global _configured, _test_exporter
+    
+    try:
+        import logfire
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+        
+        _test_exporter = InMemorySpanExporter()
+        logfire.configure(
+            send_to_logfire=False,
+            console=False,
+            service_name="fraim-context-mcp",
+            service_version="5.1.0",
+            additional_span_processors=[SimpleSpanProcessor(_test_exporter)],
+        )
+        _instrument_libraries(logfire)
+        
+        _configured = True
+        return {"configured": True, "status": "test_mode"}
+        
+    except Exception as e:
+        _configured = True
+        return {"configured": False, "status": "error", "error": str(e)}
 
 
 def setup_observability() -> dict[str, Any]:
@@ -25,6 +79,9 @@ def setup_observability() -> dict[str, Any]:
     if _configured:
         return {"configured": True, "status": "already_configured"}
     
+    if _is_test_mode():
+        return _setup_test_observability()
+    
     logfire_token = os.environ.get("LOGFIRE_TOKEN")
     
     if not logfire_token:
@@ -40,10 +97,7 @@ def setup_observability() -> dict[str, Any]:
             service_version="5.1.0",
         )
         
-        # Auto-instrument common libraries
-        logfire.instrument_asyncpg()
-        logfire.instrument_redis()
-        logfire.instrument_httpx()
+        _instrument_libraries(logfire)
         
         _configured = True
         return {"configured": True, "status": "success"}
@@ -0,0 +1,83 @@
+"""In-process circuit breaker for search upstreams.
+
+After ``failure_threshold`` consecutive failures the circuit opens and
+calls are rejected immediately with CircuitOpenError instead of hitting
+a dependency that is known to be down. Once ``reset_timeout`` seconds
+have passed the circuit is half-open: the next check() is let through
+as the single trial call and re-arms the open window, so concurrent
+callers keep being rejected. Success closes the circuit, failure
+re-opens it. A trial that records neither outcome (e.g. cancelled) just
+lets another trial through after a further ``reset_timeout``.
+"""
+
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    Usage:
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30.0)
+        breaker.check()  # raises CircuitOpenError while open
+        try:
+            result = await call()
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before the circuit opens
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected.
+
+        False once ``reset_timeout`` has elapsed, even though only the
+        next check() is let through as the trial call.
+        """
+        if self._opened_at is None:
+            return False
+        return time.monotonic() - self._opened_at < self._reset_timeout
+
+    def check(self) -> None:
+        """Raise CircuitOpenError unless this call may proceed.
+
+        When half-open, the caller becomes the trial call and the circuit
+        is re-armed, so other callers are rejected until it reports back.
+        """
+        if self.is_open:
+            raise CircuitOpenError(
+                f"Circuit open after {self._failures} consecutive failures"
+            )
+        if self._opened_at is not None:
+            # Half-open: claim the single trial slot
+            self._opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
@@ -7,9 +7,13 @@ Coordinates the complete search pipeline:
 4. Rerank results
 5. Store in cache
 
-CRITICAL: DSPy is synchronous - wrap in asyncio.to_thread() if used.
+CRITICAL: DSPy and FlashRank are synchronous - wrap in asyncio.to_thread().
+
+An optional CircuitBreaker fails searches fast while an upstream
+(Redis, embedding API, database) keeps failing.
 """
 
+import asyncio
 import time
 from uuid import UUID
 
@@ -17,6 +21,7 @@ from fraim_mcp.cache.redis_client import CacheClient, generate_cache_key
 from fraim_mcp.database.client import DatabaseClient
 from fraim_mcp.database.models import ChunkResult, SearchRequest, SearchResponse
 from fraim_mcp.ingestion.embeddings import EmbeddingClient
+from fraim_mcp.retrieval.circuit_breaker import CircuitBreaker
 from fraim_mcp.retrieval.reranker import Reranker
 
 
@@ -34,6 +39,7 @@ class SearchService:
         cache_client: CacheClient,
         embedding_client: EmbeddingClient,
         reranker: Reranker | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ):
         """Initialize the search service.
         
@@ -42,11 +48,14 @@ class SearchService:
             cache_client: Redis cache client
             embedding_client: Embedding generator
             reranker: Optional reranker (created if not provided)
+            circuit_breaker: Optional breaker; searches raise
+                CircuitOpenError while it is open
         """
         self._db = db_client
         self._cache = cache_client
         self._embeddings = embedding_client
         self._reranker = reranker or Reranker()
+        self._breaker = circuit_breaker
     
     async def _get_project_info(self, project_id: str) -> dict:
         """Get project info by slug or ID."""
@@ -85,7 +94,29 @@ class SearchService:
         
         Returns:
             SearchResponse with results and metadata
+        
+        Raises:
+            ValueError: If the project does not exist
+            CircuitOpenError: If the circuit breaker is open
         """
+        if self._breaker is None:
+            return await self._search(request)
+        
+        self._breaker.check()
+        try:
+            response = await self._search(request)
+        except ValueError:
+            # Unknown project is a caller error, not an upstream failure
+            raise
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        
+        self._breaker.record_success()
+        return response
+    
+    async def _search(self, request: SearchRequest) -> SearchResponse:
+        """Run the search pipeline (see module docstring)."""
         start_time = time.perf_counter()
         
         # Get project info
@@ -93,14 +124,17 @@ class SearchService:
         project_uuid = project_info["id"]
         corpus_version = project_info["corpus_version"]
         
-        # Generate cache key
+        # Generate cache key (covers every request field that shapes results)
         cache_key = generate_cache_key(
             project_id=request.project_id,
             corpus_version=corpus_version,
             query=request.query,
+            top_k=request.top_k,
+            category=request.category,
+            use_reranker=request.use_reranker,
         )
         
-        # Check cache
+        # Check cache before embedding so hits skip the embedding API
         cached = await self._cache.get(cache_key)
         if cached is not None:
             latency_ms = int((time.perf_counter() - start_time) * 1000)
@@ -141,9 +175,11 @@ class SearchService:
             }
             documents.append(doc)
         
-        # Rerank if enabled
+        # Rerank if enabled (FlashRank is synchronous CPU work - run it in a
+        # worker thread so concurrent requests are not blocked on the loop)
         if request.use_reranker and documents:
-            documents = self._reranker.rerank(
+            documents = await asyncio.to_thread(
+                self._reranker.rerank,
                 query=request.query,
                 documents=documents,
                 top_k=request.top_k,
@@ -20,6 +20,7 @@ from fraim_mcp.database.client import DatabaseClient
 from fraim_mcp.database.models import SearchRequest, SearchResponse
 from fraim_mcp.ingestion.embeddings import EmbeddingClient
 from fraim_mcp.observability.setup import setup_observability
+from fraim_mcp.retrieval.circuit_breaker import CircuitOpenError
 from fraim_mcp.retrieval.service import SearchService
 
 # Global clients (initialized in lifespan)
@@ -125,10 +126,12 @@ def register_routes(app: FastAPI) -> None:
         
         try:
             return await _search_service.search(request)
+        except CircuitOpenError as e:
+            raise HTTPException(status_code=503, detail=str(e)) from e
         except ValueError as e:
-            raise HTTPException(status_code=404, detail=str(e))
+            raise HTTPException(status_code=404, detail=str(e)) from e
         except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+            raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 # Create default app instance
@@ -0,0 +1,75 @@
+"""Shared pytest configuration for all stages.
+
+Set FRAIM_TEST_FAST=1 to replace embedding API calls with deterministic
+fake embeddings; tests marked ``real_embeddings`` are skipped in that mode.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+import uvloop
+
+from tests.fakes import fake_embed
+
+FAST_EMBEDDINGS = os.environ.get("FRAIM_TEST_FAST") == "1"
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """Run async tests on the session loop; skip real_embeddings in fast mode.
+
+    Async fixtures default to the session loop (pyproject.toml), so
+    session- and module-scoped clients stay usable by every test. The
+    marker is prepended so it also wins over a bare @pytest.mark.asyncio.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+    if not FAST_EMBEDDINGS:
+        return
+
+    skip_real = pytest.mark.skip(reason="FRAIM_TEST_FAST=1 uses fake embeddings")
+    for item in items:
+        if "real_embeddings" in item.keywords:
+            item.add_marker(skip_real)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run every async test and fixture on uvloop.
+
+    Tests are dominated by asyncpg/Redis awaits, where uvloop's lower
+    per-await overhead shortens fixture setup loops. pytest-asyncio 0.24
+    builds the session event loop from this policy, so no per-test
+    changes are needed.
+    """
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_embeddings():
+    """Patch the embedding API call to use fake_embed when FRAIM_TEST_FAST=1.
+
+    Only litellm's aembedding is replaced, so EmbeddingClient's own logic
+    (ordering, fallback, dimension checks) still runs, and a test can patch
+    aembedding itself to script provider responses. Session-scoped so
+    module-scoped seed fixtures are covered too.
+    """
+    if not FAST_EMBEDDINGS:
+        yield
+        return
+
+    async def aembedding(*, input, dimensions, **_kwargs):
+        return SimpleNamespace(
+            data=[
+                {"index": i, "embedding": fake_embed(text, dimensions)}
+                for i, text in enumerate(input)
+            ]
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("fraim_mcp.ingestion.embeddings.aembedding", aembedding)
+        yield
@@ -0,0 +1,32 @@
+"""Test doubles shared across stages."""
+
+import hashlib
+import re
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def fake_embed(text: str, dimension: int = 1024) -> list[float]:
+    """Deterministic unit-length pseudo-embedding (no API call).
+
+    Each lowercase token is hashed into a signed bucket with blake2b
+    (stable across processes, unlike hash()), so texts that share words
+    stay close in cosine space. Only for tests that exercise plumbing,
+    not semantic ranking.
+    """
+    vector = np.zeros(dimension, dtype=np.float32)
+
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = int.from_bytes(
+            hashlib.blake2b(token.encode(), digest_size=8).digest(), "little"
+        )
+        vector[digest % dimension] += 1.0 if digest >> 63 else -1.0
+
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        # pgvector cosine distance is undefined for the zero vector
+        vector[0] = norm = 1.0
+
+    return (vector / norm).tolist()
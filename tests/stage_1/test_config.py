@@ -84,3 +84,15 @@ def test_settings_singleton_pattern() -> None:
     # Should return the same cached instance
     assert settings1.database_url == settings2.database_url
 
+
+@pytest.mark.stage1
+def test_settings_are_immutable() -> None:
+    """Test that the shared settings instance cannot be mutated."""
+    from pydantic import ValidationError as PydanticValidationError
+    
+    from fraim_mcp.config import get_settings
+    
+    settings = get_settings()
+    
+    with pytest.raises(PydanticValidationError):
+        settings.log_level = "DEBUG"
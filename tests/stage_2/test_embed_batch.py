@@ -0,0 +1,51 @@
+"""Stage 2.2: Batch Embedding Response Handling Tests.
+
+These tests verify how embed_batch handles provider responses, using a fake
+aembedding - no API key or network needed, so they run in every mode.
+Run with: uv run pytest tests/stage_2/test_embed_batch.py -v
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from fraim_mcp.ingestion.embeddings import EmbeddingClient
+
+pytestmark = pytest.mark.stage2
+
+
+@pytest.fixture
+def embedding_client():
+    """Create an embedding client for testing."""
+    return EmbeddingClient()
+
+
+def _embedding_item(index: int, value: float) -> dict:
+    """Fake provider response item with a constant 1024-dim vector."""
+    return {"index": index, "embedding": [value] * 1024}
+
+
+async def test_batch_embedding_restores_input_order(embedding_client) -> None:
+    """Test that batch results are ordered by index, not response order."""
+    response = SimpleNamespace(data=[_embedding_item(1, 1.0), _embedding_item(0, 0.0)])
+    
+    with patch(
+        "fraim_mcp.ingestion.embeddings.aembedding", AsyncMock(return_value=response)
+    ):
+        embeddings = await embedding_client.embed_batch(["first", "second"])
+    
+    assert [emb[0] for emb in embeddings] == [0.0, 1.0]
+
+
+async def test_batch_embedding_falls_back_on_short_response(embedding_client) -> None:
+    """Test that a partial batch response falls back to per-text requests."""
+    async def fake_aembedding(*, input, **_kwargs):
+        if len(input) > 1:
+            return SimpleNamespace(data=[_embedding_item(0, 0.0)])  # Truncated
+        return SimpleNamespace(data=[_embedding_item(0, float(len(input[0])))])
+    
+    with patch("fraim_mcp.ingestion.embeddings.aembedding", side_effect=fake_aembedding):
+        embeddings = await embedding_client.embed_batch(["a", "bb", "ccc"])
+    
+    assert [emb[0] for emb in embeddings] == [1.0, 2.0, 3.0]
@@ -151,6 +151,7 @@ async def test_retrieve_embedding_as_list(db_client, test_project, embedding_cli
 
 
 @pytest.mark.asyncio
+@pytest.mark.real_embeddings
 async def test_vector_similarity_search(db_client, test_project, embedding_client) -> None:
     """Test vector similarity search returns relevant results."""
     # Insert multiple chunks with different content
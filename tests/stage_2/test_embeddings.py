@@ -8,7 +8,7 @@ HARD CONTRACT: All embeddings MUST be 1024 dimensions (voyage-3 model).
 
 import pytest
 
-pytestmark = pytest.mark.stage2
+pytestmark = [pytest.mark.stage2, pytest.mark.real_embeddings]
 
 
 @pytest.fixture
@@ -98,4 +98,3 @@ def test_embedding_client_has_model_info(embedding_client) -> None:
     """Test that embedding client exposes model information."""
     assert embedding_client.model_name is not None
     assert embedding_client.dimension == 1024
-
@@ -134,6 +134,23 @@ async def test_cache_key_generation(cache_client) -> None:
     assert key1.startswith("fraim:my-project:v42:search:")
 
 
+def test_cache_key_includes_search_options() -> None:
+    """Test that options which change the result set change the cache key."""
+    from fraim_mcp.cache.redis_client import generate_cache_key
+    
+    base = generate_cache_key("my-project", 42, "how does auth work")
+    
+    # Defaults match SearchRequest defaults
+    assert base == generate_cache_key(
+        "my-project", 42, "how does auth work", top_k=5, category=None, use_reranker=True
+    )
+    
+    # Each result-shaping option yields a distinct key
+    assert base != generate_cache_key("my-project", 42, "how does auth work", top_k=10)
+    assert base != generate_cache_key("my-project", 42, "how does auth work", category="api")
+    assert base != generate_cache_key("my-project", 42, "how does auth work", use_reranker=False)
+
+
 @pytest.mark.asyncio
 async def test_cache_handles_none_gracefully(cache_client) -> None:
     """Test that getting non-existent key returns None."""
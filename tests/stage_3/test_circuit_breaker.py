@@ -0,0 +1,109 @@
+"""Stage 3.5: Circuit Breaker Tests.
+
+These tests verify the in-process circuit breaker used by SearchService.
+Run with: uv run pytest tests/stage_3/test_circuit_breaker.py -v
+
+Pure state-machine tests - no database, cache or network.
+"""
+
+import pytest
+
+from fraim_mcp.retrieval import circuit_breaker
+from fraim_mcp.retrieval.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+pytestmark = pytest.mark.stage3
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    """Drive the breaker's clock by hand instead of sleeping."""
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", fake)
+    return fake
+
+
+def test_breaker_opens_at_threshold() -> None:
+    """Test that the circuit opens after N consecutive failures."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.check()  # Still closed below the threshold
+
+    breaker.record_failure()
+    assert breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_success_resets_failure_count() -> None:
+    """Test that a success clears earlier failures."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert not breaker.is_open
+
+
+def test_half_open_lets_one_trial_through(clock) -> None:
+    """Test that only one call gets through once reset_timeout has elapsed."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.advance(30)
+    breaker.check()  # The trial call
+
+    # Concurrent callers are rejected while the trial is in flight
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_successful_trial_closes_circuit(clock) -> None:
+    """Test that a successful trial closes the circuit for every caller."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.advance(30)
+    breaker.check()
+    breaker.record_success()
+
+    breaker.check()
+    breaker.check()
+    assert not breaker.is_open
+
+
+def test_failed_trial_reopens_circuit(clock) -> None:
+    """Test that a failed trial keeps the circuit open for another full timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.advance(30)
+    breaker.check()
+    breaker.record_failure()
+
+    clock.advance(29)
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    clock.advance(1)
+    breaker.check()  # Next trial
+
+
+def test_breaker_rejects_invalid_threshold() -> None:
+    """Test that a threshold below 1 is rejected."""
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_threshold=0)
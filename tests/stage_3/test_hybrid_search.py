@@ -4,14 +4,26 @@ These tests verify the hybrid (vector + FTS) search implementation.
 Run with: doppler run -- uv run pytest tests/stage_3/test_hybrid_search.py -v
 """
 
+import asyncio
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from uuid_utils.compat import uuid7
 
 pytestmark = pytest.mark.stage3
 
+# Sample content for different categories (content, category)
+CONTENTS = (
+    ("Python programming basics and syntax tutorial.", "references"),
+    ("PostgreSQL database optimization and query tuning.", "references"),
+    ("JWT authentication and OAuth2 security flows.", "references"),
+    ("CI/CD pipeline configuration with GitHub Actions.", "process"),
+    ("Project coding style guidelines and conventions.", "workspace"),
+)
 
-@pytest.fixture
+
+@pytest_asyncio.fixture(scope="module")
 async def db_client():
     """Create a database client for testing."""
     from fraim_mcp.database.client import DatabaseClient
@@ -22,29 +34,28 @@ async def db_client():
     await client.disconnect()
 
 
-@pytest.fixture
-async def embedding_client():
+@pytest.fixture(scope="module")
+def embedding_client():
     """Create an embedding client."""
     from fraim_mcp.ingestion.embeddings import EmbeddingClient
     
     return EmbeddingClient()
 
 
-@pytest.fixture
-async def test_project_with_data(db_client, embedding_client):
-    """Create a test project with sample documents and chunks."""
-    project_id = uuid4()
+@pytest_asyncio.fixture(scope="module")
+async def seeded_embeddings(embedding_client):
+    """Embed CONTENTS once per module in a single batch call."""
+    texts = [content for content, _ in CONTENTS]
+    embeddings = await embedding_client.embed_batch(texts)
+    return dict(zip(texts, embeddings, strict=True))
+
+
+@pytest_asyncio.fixture(scope="module")
+async def test_project_with_data(db_client, seeded_embeddings):
+    """Create one test project with sample documents and chunks per module."""
+    project_id = uuid7()
     slug = f"hybrid-test-{uuid4().hex[:8]}"
-    doc_id = uuid4()
-    
-    # Sample content for different categories
-    contents = [
-        ("Python programming basics and syntax tutorial.", "references"),
-        ("PostgreSQL database optimization and query tuning.", "references"),
-        ("JWT authentication and OAuth2 security flows.", "references"),
-        ("CI/CD pipeline configuration with GitHub Actions.", "process"),
-        ("Project coding style guidelines and conventions.", "workspace"),
-    ]
+    doc_id = uuid7()
     
     async with db_client._pool.acquire() as conn:
         # Create project
@@ -68,32 +79,58 @@ async def test_project_with_data(db_client, embedding_client):
             "references",
         )
         
-        # Create chunks with embeddings
-        for i, (content, category) in enumerate(contents):
-            embedding = await embedding_client.embed(content)
-            chunk_id = uuid4()
-            
-            await conn.execute(
-                """
-                INSERT INTO chunks (id, document_id, project_id, content, embedding, chunk_index)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                """,
-                chunk_id,
-                doc_id,
-                project_id,
-                content,
-                embedding,
-                i,
-            )
+        # Create chunks with embeddings: parse the INSERT once, then send
+        # every row through the prepared statement in one batch
+        insert_chunk = await conn.prepare(
+            """
+            INSERT INTO chunks (id, document_id, project_id, content, embedding, chunk_index)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            """
+        )
+        await insert_chunk.executemany(
+            [
+                (uuid7(), doc_id, project_id, content, seeded_embeddings[content], i)
+                for i, (content, _) in enumerate(CONTENTS)
+            ]
+        )
     
     yield {"id": project_id, "slug": slug}
     
-    # Cleanup
+    # Cleanup once per module: a single cascading delete instead of one
+    # per test (no TRUNCATE - the database is shared with real projects)
     async with db_client._pool.acquire() as conn:
         await conn.execute("DELETE FROM projects WHERE id = $1", project_id)
 
 
-@pytest.mark.asyncio
+async def embed_and_search(
+    db_client,
+    embedding_client,
+    project_id,
+    query: str,
+    limit: int,
+    fts_query: str | None = None,
+    category: str | None = None,
+) -> list:
+    """Call hybrid_search, embedding the query while a connection is acquired."""
+    embed_task = asyncio.create_task(embedding_client.embed(query))
+    try:
+        async with db_client._pool.acquire() as conn:
+            query_embedding = await embed_task
+            return await conn.fetch(
+                """
+                SELECT * FROM hybrid_search($1, $2, $3, $4, $5)
+                """,
+                project_id,
+                query_embedding,
+                fts_query or query,
+                limit,
+                category,
+            )
+    finally:
+        embed_task.cancel()
+
+
+@pytest.mark.real_embeddings
 async def test_vector_search_returns_results(db_client, test_project_with_data, embedding_client) -> None:
     """Test that vector search returns relevant results."""
     query_embedding = await embedding_client.embed("How to optimize database queries?")
@@ -116,7 +153,6 @@ async def test_vector_search_returns_results(db_client, test_project_with_data,
     assert "database" in results[0]["content"].lower() or "postgresql" in results[0]["content"].lower()
 
 
-@pytest.mark.asyncio
 async def test_fts_search_returns_results(db_client, test_project_with_data) -> None:
     """Test that full-text search returns results."""
     async with db_client._pool.acquire() as conn:
@@ -138,23 +174,17 @@ async def test_fts_search_returns_results(db_client, test_project_with_data) ->
     assert "authentication" in results[0]["content"].lower() or "security" in results[0]["content"].lower()
 
 
-@pytest.mark.asyncio
+@pytest.mark.real_embeddings
 async def test_hybrid_combines_scores(db_client, test_project_with_data, embedding_client) -> None:
     """Test that hybrid search combines vector and FTS scores."""
-    query = "PostgreSQL query optimization"
-    query_embedding = await embedding_client.embed(query)
-    
-    async with db_client._pool.acquire() as conn:
-        # Use the hybrid_search function from init_db.sql
-        results = await conn.fetch(
-            """
-            SELECT * FROM hybrid_search($1, $2, $3, $4)
-            """,
-            test_project_with_data["id"],
-            query_embedding,
-            query,
-            5,  # limit
-        )
+    # Use the hybrid_search function from init_db.sql
+    results = await embed_and_search(
+        db_client,
+        embedding_client,
+        test_project_with_data["id"],
+        "PostgreSQL query optimization",
+        5,  # limit
+    )
     
     assert len(results) > 0
     
@@ -164,23 +194,18 @@ async def test_hybrid_combines_scores(db_client, test_project_with_data, embeddi
         assert row["score"] > 0
 
 
-@pytest.mark.asyncio
 async def test_category_filter_works(db_client, test_project_with_data, embedding_client) -> None:
     """Test that category filter restricts results."""
-    query_embedding = await embedding_client.embed("How does this work?")
-    
-    async with db_client._pool.acquire() as conn:
-        # Search with category filter
-        results = await conn.fetch(
-            """
-            SELECT * FROM hybrid_search($1, $2, $3, $4, $5)
-            """,
-            test_project_with_data["id"],
-            query_embedding,
-            "configuration",
-            5,  # limit
-            "process",  # category filter
-        )
+    # Search with category filter
+    results = await embed_and_search(
+        db_client,
+        embedding_client,
+        test_project_with_data["id"],
+        "How does this work?",
+        5,  # limit
+        fts_query="configuration",
+        category="process",
+    )
     
     # Results should only be from 'process' category (CI/CD content)
     # The function may return empty if no FTS match, which is fine
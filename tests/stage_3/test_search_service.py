@@ -11,11 +11,19 @@ CRITICAL: DSPy is synchronous and MUST be wrapped in asyncio.to_thread()
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
+from uuid_utils.compat import uuid7
 
 pytestmark = pytest.mark.stage3
 
+CONTENTS = (
+    "How to authenticate users with JWT tokens.",
+    "Database schema design best practices.",
+    "API rate limiting implementation guide.",
+)
 
-@pytest.fixture
+
+@pytest_asyncio.fixture(scope="module")
 async def db_client():
     """Create a database client."""
     from fraim_mcp.database.client import DatabaseClient
@@ -26,7 +34,7 @@ async def db_client():
     await client.disconnect()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module")
 async def cache_client():
     """Create a cache client."""
     from fraim_mcp.cache.redis_client import CacheClient
@@ -37,26 +45,27 @@ async def cache_client():
     await client.disconnect()
 
 
-@pytest.fixture
-async def embedding_client():
+@pytest.fixture(scope="module")
+def embedding_client():
     """Create an embedding client."""
     from fraim_mcp.ingestion.embeddings import EmbeddingClient
     
     return EmbeddingClient()
 
 
-@pytest.fixture
-async def test_project_with_data(db_client, embedding_client):
-    """Create a test project with sample data."""
-    project_id = uuid4()
+@pytest_asyncio.fixture(scope="module")
+async def seeded_embeddings(embedding_client):
+    """Embed CONTENTS once per module in a single batch call."""
+    embeddings = await embedding_client.embed_batch(list(CONTENTS))
+    return dict(zip(CONTENTS, embeddings, strict=True))
+
+
+@pytest_asyncio.fixture(scope="module")
+async def test_project_with_data(db_client, seeded_embeddings):
+    """Create one test project with sample data per module."""
+    project_id = uuid7()
     slug = f"search-svc-{uuid4().hex[:8]}"
-    doc_id = uuid4()
-    
-    contents = [
-        "How to authenticate users with JWT tokens.",
-        "Database schema design best practices.",
-        "API rate limiting implementation guide.",
-    ]
+    doc_id = uuid7()
     
     async with db_client._pool.acquire() as conn:
         await conn.execute(
@@ -74,22 +83,19 @@ async def test_project_with_data(db_client, embedding_client):
             "hash123",
         )
         
-        for i, content in enumerate(contents):
-            embedding = await embedding_client.embed(content)
-            chunk_id = uuid4()
-            
-            await conn.execute(
-                """
-                INSERT INTO chunks (id, document_id, project_id, content, embedding, chunk_index)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                """,
-                chunk_id,
-                doc_id,
-                project_id,
-                content,
-                embedding,
-                i,
-            )
+        # Parse the chunk INSERT once and send all rows in one batch
+        insert_chunk = await conn.prepare(
+            """
+            INSERT INTO chunks (id, document_id, project_id, content, embedding, chunk_index)
+            VALUES ($1, $2, $3, $4, $5, $6)
+            """
+        )
+        await insert_chunk.executemany(
+            [
+                (uuid7(), doc_id, project_id, content, seeded_embeddings[content], i)
+                for i, content in enumerate(CONTENTS)
+            ]
+        )
         
         # Get corpus version
         corpus_version = await conn.fetchval(
@@ -99,12 +105,13 @@ async def test_project_with_data(db_client, embedding_client):
     
     yield {"id": project_id, "slug": slug, "corpus_version": corpus_version}
     
-    # Cleanup
+    # Cleanup once per module: a single cascading delete instead of one
+    # per test (no TRUNCATE - the database is shared with real projects)
     async with db_client._pool.acquire() as conn:
         await conn.execute("DELETE FROM projects WHERE id = $1", project_id)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module")
 async def search_service(db_client, cache_client, embedding_client):
     """Create a search service instance."""
     from fraim_mcp.retrieval.service import SearchService
@@ -116,7 +123,6 @@ async def search_service(db_client, cache_client, embedding_client):
     )
 
 
-@pytest.mark.asyncio
 async def test_search_returns_results(search_service, test_project_with_data) -> None:
     """Test that search service returns results."""
     from fraim_mcp.database.models import SearchRequest
@@ -134,7 +140,6 @@ async def test_search_returns_results(search_service, test_project_with_data) ->
     assert response.project_id == request.project_id
 
 
-@pytest.mark.asyncio
 async def test_search_uses_cache(search_service, test_project_with_data, cache_client) -> None:
     """Test that search uses cache for repeated queries."""
     from fraim_mcp.database.models import SearchRequest
@@ -157,7 +162,6 @@ async def test_search_uses_cache(search_service, test_project_with_data, cache_c
     assert len(response1.results) == len(response2.results)
 
 
-@pytest.mark.asyncio
 async def test_search_cache_miss_stores(search_service, test_project_with_data, cache_client) -> None:
     """Test that cache miss stores results for future use."""
     from fraim_mcp.cache.redis_client import generate_cache_key
@@ -176,6 +180,7 @@ async def test_search_cache_miss_stores(search_service, test_project_with_data,
         project_id=test_project_with_data["slug"],
         corpus_version=test_project_with_data["corpus_version"],
         query=unique_query,
+        top_k=request.top_k,
     )
     
     # Initially should not be cached
@@ -190,7 +195,6 @@ async def test_search_cache_miss_stores(search_service, test_project_with_data,
     assert cached is not None
 
 
-@pytest.mark.asyncio
 async def test_search_with_reranking(search_service, test_project_with_data) -> None:
     """Test that search applies reranking when enabled."""
     from fraim_mcp.database.models import SearchRequest
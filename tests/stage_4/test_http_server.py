@@ -4,31 +4,54 @@ These tests verify the FastAPI HTTP server implementation.
 Run with: doppler run -- uv run pytest tests/stage_4/test_http_server.py -v
 """
 
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock
+
 import pytest
+import pytest_asyncio
+from asgi_lifespan import LifespanManager
 from httpx import ASGITransport, AsyncClient
 
+from fraim_mcp.retrieval.circuit_breaker import CircuitOpenError
+
 pytestmark = pytest.mark.stage4
 
+# Startup connects to DB and Redis and loads the reranker model, which may
+# be downloaded on a cold start - far beyond LifespanManager's 5s default
+_STARTUP_TIMEOUT = 120
+
 
-@pytest.fixture
-async def app():
-    """Create the FastAPI app."""
+@pytest.fixture(scope="module")
+def app():
+    """Create the FastAPI app once per module."""
     from fraim_mcp.server.http_server import create_app
     
     return create_app()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="module")
 async def client(app):
-    """Create an async test client."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as client:
+    """Create an async test client with the app lifespan running.
+    
+    ASGITransport does not send lifespan events, so LifespanManager runs
+    startup (DB pool, cache, embedding client, reranker) once and every
+    test in the module reuses the warm app. If startup fails, the
+    module is skipped instead of erroring every test.
+    """
+    async with AsyncExitStack() as stack:
+        try:
+            manager = await stack.enter_async_context(
+                LifespanManager(app, startup_timeout=_STARTUP_TIMEOUT)
+            )
+        except Exception as e:
+            pytest.skip(f"App lifespan failed to start: {e!r}")
+        
+        client = await stack.enter_async_context(
+            AsyncClient(transport=ASGITransport(app=manager.app), base_url="http://test")
+        )
         yield client
 
 
-@pytest.mark.asyncio
 async def test_health_endpoint(client) -> None:
     """Test the health check endpoint."""
     response = await client.get("/health")
@@ -41,7 +64,6 @@ async def test_health_endpoint(client) -> None:
     assert "version" in data
 
 
-@pytest.mark.asyncio
 async def test_search_endpoint(client) -> None:
     """Test the search endpoint."""
     # Use default project which should exist
@@ -54,8 +76,8 @@ async def test_search_endpoint(client) -> None:
         },
     )
     
-    # Should return 200 or 503 (if service not fully initialized in test)
-    # In production with lifespan, this would be 200
+    # Lifespan runs via LifespanManager, so this is normally 200;
+    # 503 means the search service failed to initialize
     assert response.status_code in (200, 503)
     
     if response.status_code == 200:
@@ -65,7 +87,6 @@ async def test_search_endpoint(client) -> None:
         assert "latency_ms" in data
 
 
-@pytest.mark.asyncio
 async def test_search_endpoint_validation(client) -> None:
     """Test search endpoint validation."""
     # Empty query should fail
@@ -80,7 +101,6 @@ async def test_search_endpoint_validation(client) -> None:
     assert response.status_code == 422  # Validation error
 
 
-@pytest.mark.asyncio
 async def test_root_endpoint(client) -> None:
     """Test the root endpoint returns API info."""
     response = await client.get("/")
@@ -91,3 +111,22 @@ async def test_root_endpoint(client) -> None:
     assert "name" in data
     assert "version" in data
 
+
+async def test_search_endpoint_circuit_open(app, monkeypatch) -> None:
+    """Test that an open circuit breaker maps to 503."""
+    from fraim_mcp.server import http_server
+    
+    service = AsyncMock()
+    service.search.side_effect = CircuitOpenError("Circuit open after 5 consecutive failures")
+    monkeypatch.setattr(http_server, "_search_service", service)
+    
+    # No lifespan: the stub service stands in for the real one
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/search",
+            json={"query": "test query", "project_id": "default"},
+        )
+    
+    assert response.status_code == 503
+    assert "Circuit open" in response.json()["detail"]
+
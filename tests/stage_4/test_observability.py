@@ -35,3 +35,48 @@ def test_observability_returns_configured_status() -> None:
     assert isinstance(result, dict)
     assert "configured" in result
 
+
+@pytest.fixture
+def fresh_setup(monkeypatch):
+    """Reset module state so setup_observability() runs from scratch."""
+    from fraim_mcp.observability import setup
+    
+    monkeypatch.setattr(setup, "_configured", False)
+    monkeypatch.setattr(setup, "_test_exporter", None)
+    monkeypatch.delenv("FRAIM_OBS_MODE", raising=False)
+    return setup
+
+
+@pytest.mark.parametrize(
+    ("env_var", "value"),
+    [("FRAIM_OBS_MODE", "test"), ("PYTEST_CURRENT_TEST", "test_observability.py::test")],
+)
+def test_test_mode_uses_in_memory_setup(fresh_setup, monkeypatch, env_var, value) -> None:
+    """Test that either test-mode signal selects the in-memory setup."""
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    monkeypatch.setenv(env_var, value)
+    monkeypatch.setattr(
+        fresh_setup, "_setup_test_observability", lambda: {"status": "test_mode"}
+    )
+    
+    assert fresh_setup.setup_observability() == {"status": "test_mode"}
+
+
+def test_test_mode_exposes_span_exporter(fresh_setup, monkeypatch) -> None:
+    """Test that spans recorded in test mode reach the exporter handle."""
+    logfire = pytest.importorskip("logfire")
+    monkeypatch.setenv("FRAIM_OBS_MODE", "test")
+    
+    result = fresh_setup.setup_observability()
+    assert result["status"] == "test_mode"
+    
+    exporter = fresh_setup.get_test_span_exporter()
+    assert exporter is not None
+    exporter.clear()
+    
+    with logfire.span("observability-test-span"):
+        pass
+    
+    names = [span.name for span in exporter.get_finished_spans()]
+    assert "observability-test-span" in names
+    exporter.clear()
@@ -0,0 +1,82 @@
+"""Shared Stage 5 fixtures.
+
+Connections are opened once per session and shared by every test that
+asks for them (all async tests run on the session event loop; see
+tests/conftest.py).
+
+Each live service is probed once, with a short timeout. If it is not
+configured or not reachable, every test depending on it is skipped
+instead of each one waiting out its own connect timeout.
+"""
+
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+import pytest_asyncio
+from pydantic import ValidationError
+
+from fraim_mcp.cache.redis_client import RedisClient
+from fraim_mcp.config import get_settings
+from fraim_mcp.database.client import DatabaseClient
+from fraim_mcp.ingestion.embeddings import EmbeddingClient
+
+# Seconds to wait for a live service before skipping its dependents
+_PROBE_TIMEOUT = 2.0
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """Get application settings."""
+    try:
+        return get_settings()
+    except ValidationError as e:
+        pytest.skip(f"Settings not configured: {e.error_count()} invalid field(s)")
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_client(settings):
+    """Shared database client for the whole session."""
+    client = DatabaseClient(settings.database_url)
+    try:
+        async with asyncio.timeout(_PROBE_TIMEOUT):
+            await client.connect()
+    except Exception as e:
+        pytest.skip(f"Database unavailable: {e!r}")
+    yield client
+    await client.disconnect()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def cache_client(settings):
+    """Shared Redis client for the whole session."""
+    client = RedisClient(settings.redis_url)
+    await client.connect()
+    try:
+        async with asyncio.timeout(_PROBE_TIMEOUT):
+            reachable = await client.ping()
+    except TimeoutError:
+        reachable = False
+    if not reachable:
+        await client.close()
+        pytest.skip("Redis unavailable")
+    yield client
+    await client.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def fake_cache_client():
+    """RedisClient backed by in-process fakeredis (no Redis server needed).
+
+    For tests where the cache is incidental to what is being exercised.
+    """
+    client = RedisClient("redis://fakeredis")
+    client._client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def embedding_client(settings):
+    """Shared embedding client for the whole session."""
+    return EmbeddingClient(api_key=settings.open_ai_api)
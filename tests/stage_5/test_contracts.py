@@ -2,10 +2,15 @@
 Stage 5.2: Contract Tests
 
 Validates that all API responses match the contracts defined in CONTRACTS.md.
+Pure model construction with no I/O, so safe to run with ``pytest -n auto``.
 """
 
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from fraim_mcp.database.models import (
     ChunkResult,
@@ -16,24 +21,104 @@ from fraim_mcp.database.models import (
     ErrorResponse,
 )
 
+# Fixed values instead of per-test uuid4()/utcnow() calls; also makes
+# payloads deterministic
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_UUID_POOL = [UUID(int=i) for i in range(64)]
+
+# Serializes a whole document list in one pydantic-core call
+_DOC_LIST_ADAPTER = TypeAdapter(list[Document])
+
+
+def _make_chunk(**overrides) -> ChunkResult:
+    """Build a valid ChunkResult, overriding only the fields under test."""
+    fields = {
+        "id": _UUID_POOL[0],
+        "document_id": _UUID_POOL[1],
+        "document_path": "/p",
+        "content": "x",
+        "score": 0.5,
+        "chunk_index": 0,
+    }
+    fields.update(overrides)
+    return ChunkResult(**fields)
+
+
+def _make_response(**overrides) -> SearchResponse:
+    """Build a valid SearchResponse, overriding only the fields under test."""
+    fields = {
+        "query": "test",
+        "results": [],
+        "project_id": "test-project",
+        "total_found": 0,
+        "latency_ms": 10,
+        "cache_hit": False,
+        "corpus_version": 1,
+    }
+    fields.update(overrides)
+    return SearchResponse(**fields)
+
+
+# Serialized payloads are built once per module and shared by the tests
+# that inspect them. json.loads(model_dump_json()) is exactly what goes
+# over the wire, produced by pydantic-core's JSON serializer.
+
+@pytest.fixture(scope="module")
+def search_response_json() -> dict:
+    """A one-result SearchResponse as the API would send it."""
+    chunk = _make_chunk(
+        document_path="/auth/oauth.md",
+        content="OAuth2 authentication flow involves...",
+        score=0.92,
+    )
+    response = _make_response(
+        query="authentication", results=[chunk], total_found=1, cache_hit=True
+    )
+    return json.loads(response.model_dump_json())
+
+
+@pytest.fixture(scope="module")
+def error_response_json() -> dict:
+    """An ErrorResponse as the API would send it."""
+    error = ErrorResponse(
+        error="internal_error",
+        code="INTERNAL_ERROR",
+        request_id="req-abc-123",
+    )
+    return json.loads(error.model_dump_json())
+
+
+@pytest.fixture(scope="module")
+def document_list_json() -> list[dict]:
+    """A list_docs payload of two documents."""
+    docs = [
+        Document(
+            id=_UUID_POOL[2],
+            project_id=_UUID_POOL[3],
+            path="/docs/getting-started.md",
+            content_hash="hash1",
+            created_at=_NOW,
+            updated_at=_NOW,
+        ),
+        Document(
+            id=_UUID_POOL[4],
+            project_id=_UUID_POOL[5],
+            path="/docs/api-reference.md",
+            content_hash="hash2",
+            created_at=_NOW,
+            updated_at=_NOW,
+        ),
+    ]
+    return json.loads(_DOC_LIST_ADAPTER.dump_json(docs))
+
 
 class TestSearchResponseSchema:
     """Validate SearchResponse matches contract."""
     
     def test_search_response_required_fields(self):
         """SearchResponse must have all required fields."""
-        from uuid import uuid4
-        
         # Valid response
-        response = SearchResponse(
-            query="test query",
-            results=[],
-            project_id="test-project",
-            total_found=0,
-            latency_ms=10,
-            cache_hit=False,
-            corpus_version=1,
-        )
+        response = _make_response(query="test query")
         
         assert response.query == "test query"
         assert response.results == []
@@ -42,57 +127,23 @@ class TestSearchResponseSchema:
     
     def test_search_response_with_results(self):
         """SearchResponse with actual results."""
-        from uuid import uuid4
-        
-        chunk = ChunkResult(
-            id=uuid4(),
-            document_id=uuid4(),
+        chunk = _make_chunk(
             document_path="/docs/test.md",
             content="Test content here",
             score=0.95,
             category="docs",
-            chunk_index=0,
             metadata={"source": "test"},
         )
         
-        response = SearchResponse(
-            query="test",
-            results=[chunk],
-            project_id="test-project",
-            total_found=1,
-            latency_ms=42,
-            cache_hit=False,
-            corpus_version=1,
-        )
+        response = _make_response(results=[chunk], total_found=1, latency_ms=42)
         
         assert len(response.results) == 1
         assert response.results[0].score == 0.95
         assert response.latency_ms == 42
     
-    def test_search_response_serialization(self):
+    def test_search_response_serialization(self, search_response_json):
         """SearchResponse must serialize to JSON-compatible dict."""
-        from uuid import uuid4
-        
-        chunk = ChunkResult(
-            id=uuid4(),
-            document_id=uuid4(),
-            document_path="/docs/test.md",
-            content="Test content",
-            score=0.9,
-            chunk_index=0,
-        )
-        
-        response = SearchResponse(
-            query="test",
-            results=[chunk],
-            project_id="test-project",
-            total_found=1,
-            latency_ms=10,
-            cache_hit=True,
-            corpus_version=1,
-        )
-        
-        data = response.model_dump(mode="json")
+        data = search_response_json
         
         # All fields should be JSON serializable
         assert isinstance(data, dict)
@@ -106,11 +157,9 @@ class TestChunkResultSchema:
     
     def test_chunk_result_required_fields(self):
         """ChunkResult must have required fields."""
-        from uuid import uuid4
-        
         chunk = ChunkResult(
-            id=uuid4(),
-            document_id=uuid4(),
+            id=_UUID_POOL[6],
+            document_id=_UUID_POOL[7],
             document_path="/path/to/doc.md",
             content="The actual chunk content",
             score=0.85,
@@ -123,37 +172,16 @@ class TestChunkResultSchema:
     
     def test_chunk_result_optional_fields(self):
         """ChunkResult optional fields have correct defaults."""
-        from uuid import uuid4
-        
-        chunk = ChunkResult(
-            id=uuid4(),
-            document_id=uuid4(),
-            document_path="/doc.md",
-            content="Content",
-            score=0.5,
-            chunk_index=0,
-        )
+        chunk = _make_chunk()
         
         # Default category
         assert chunk.category == "general"
         assert isinstance(chunk.metadata, dict)
     
-    def test_chunk_result_score_bounds(self):
+    @pytest.mark.parametrize("score", [0.0, 1.0])
+    def test_chunk_result_score_bounds(self, score):
         """Score should typically be between 0 and 1."""
-        from uuid import uuid4
-        
-        # Valid scores
-        chunk = ChunkResult(
-            id=uuid4(), document_id=uuid4(), document_path="/p",
-            content="x", score=0.0, chunk_index=0
-        )
-        assert chunk.score == 0.0
-        
-        chunk = ChunkResult(
-            id=uuid4(), document_id=uuid4(), document_path="/p",
-            content="x", score=1.0, chunk_index=0
-        )
-        assert chunk.score == 1.0
+        assert _make_chunk(score=score).score == score
 
 
 class TestSearchRequestSchema:
@@ -191,6 +219,20 @@ class TestSearchRequestSchema:
         
         with pytest.raises(ValidationError):
             SearchRequest(project_id="proj", query="")  # Empty query
+    
+    def test_search_request_model_copy_skips_validation(self):
+        """model_copy(update=...) does not re-run field validators.
+        
+        Request factories built on model_copy (see test_chaos.py) are
+        only safe when the updated values already satisfy the contract.
+        """
+        base = SearchRequest(query="test", project_id="proj")
+        
+        copied = base.model_copy(update={"query": ""})
+        assert copied.query == ""  # Accepted without validation
+        
+        with pytest.raises(ValidationError):
+            SearchRequest.model_validate(copied.model_dump())
 
 
 class TestDocumentSchema:
@@ -198,32 +240,26 @@ class TestDocumentSchema:
     
     def test_document_creation(self):
         """Document can be created with required fields."""
-        from datetime import datetime
-        from uuid import uuid4
-        
         doc = Document(
-            id=uuid4(),
-            project_id=uuid4(),
+            id=_UUID_POOL[8],
+            project_id=_UUID_POOL[9],
             path="/docs/readme.md",
             content_hash="sha256-abc123",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         
         assert doc.path == "/docs/readme.md"
     
     def test_document_with_metadata(self):
         """Document supports metadata field."""
-        from datetime import datetime
-        from uuid import uuid4
-        
         doc = Document(
-            id=uuid4(),
-            project_id=uuid4(),
+            id=_UUID_POOL[10],
+            project_id=_UUID_POOL[11],
             path="/doc.md",
             content_hash="hash",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
             metadata={"author": "test", "version": 2},
         )
         
@@ -236,30 +272,24 @@ class TestProjectSchema:
     
     def test_project_creation(self):
         """Project can be created."""
-        from datetime import datetime
-        from uuid import uuid4
-        
         project = Project(
-            id=uuid4(),
+            id=_UUID_POOL[12],
             slug="my-project",
             name="My Documentation Project",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         
         assert project.name == "My Documentation Project"
     
     def test_project_with_settings(self):
         """Project supports settings/config."""
-        from datetime import datetime
-        from uuid import uuid4
-        
         project = Project(
-            id=uuid4(),
+            id=_UUID_POOL[13],
             slug="test-project",
             name="Test Project",
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=_NOW,
+            updated_at=_NOW,
             settings={"default_top_k": 10, "cache_ttl": 3600},
         )
         
@@ -289,15 +319,9 @@ class TestErrorResponseSchema:
         
         assert error.detail == "Invalid request parameters"
     
-    def test_error_response_serialization(self):
+    def test_error_response_serialization(self, error_response_json):
         """ErrorResponse serializes correctly for API responses."""
-        error = ErrorResponse(
-            error="internal_error",
-            code="INTERNAL_ERROR",
-            request_id="req-abc-123",
-        )
-        
-        data = error.model_dump()
+        data = error_response_json
         assert isinstance(data, dict)
         assert data["error"] == "internal_error"
         assert data["request_id"] == "req-abc-123"
@@ -319,61 +343,18 @@ class TestMCPToolSchemas:
         request = SearchRequest(**tool_input)
         assert request.query == "How to authenticate?"
     
-    def test_search_docs_output_schema(self):
+    def test_search_docs_output_schema(self, search_response_json):
         """search_docs tool output is LLM-friendly."""
-        from uuid import uuid4
-        
-        chunk = ChunkResult(
-            id=uuid4(),
-            document_id=uuid4(),
-            document_path="/auth/oauth.md",
-            content="OAuth2 authentication flow involves...",
-            score=0.92,
-            chunk_index=0,
-        )
-        
-        response = SearchResponse(
-            query="authentication",
-            results=[chunk],
-            project_id="test-project",
-            total_found=1,
-            latency_ms=10,
-            cache_hit=False,
-            corpus_version=1,
-        )
-        
         # Tool returns text content that's useful for LLM
-        output = response.model_dump(mode="json")
+        output = search_response_json
         
         # Results should have content the LLM can use
         assert "content" in output["results"][0]
         assert len(output["results"][0]["content"]) > 0
     
-    def test_list_docs_output_schema(self):
+    def test_list_docs_output_schema(self, document_list_json):
         """list_docs tool returns document listing."""
-        from datetime import datetime
-        from uuid import uuid4
-        
-        docs = [
-            Document(
-                id=uuid4(),
-                project_id=uuid4(),
-                path="/docs/getting-started.md",
-                content_hash="hash1",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            ),
-            Document(
-                id=uuid4(),
-                project_id=uuid4(),
-                path="/docs/api-reference.md",
-                content_hash="hash2",
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            ),
-        ]
-        
         # Should be serializable
-        output = [d.model_dump(mode="json") for d in docs]
+        output = document_list_json
         assert len(output) == 2
         assert output[0]["path"] == "/docs/getting-started.md"
@@ -2,134 +2,286 @@
 Stage 5.1: End-to-End Integration Tests
 
 Tests the full system flow from ingestion through search.
+
+Database/Redis/embedding clients, the search service and one test
+project are session-scoped; each test writes its documents under its own
+path namespace and deletes only those.
 """
 
-import pytest
 import asyncio
+import hashlib
 import json
-import uuid
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime, timezone
 from uuid import UUID
 
-from fraim_mcp.config import get_settings
-from fraim_mcp.database.client import DatabaseClient
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from fraim_mcp.cache.redis_client import generate_cache_key
 from fraim_mcp.database.models import SearchRequest
-from fraim_mcp.cache.redis_client import RedisClient
-from fraim_mcp.ingestion.embeddings import EmbeddingClient
 from fraim_mcp.retrieval.service import SearchService
+from tests.fakes import fake_embed
 
+# chunks.metadata for every test chunk (JSON-encoded once)
+_EMPTY_METADATA = "{}"
 
-@pytest.fixture
-def settings():
-    """Get application settings."""
-    return get_settings()
+# created_at/updated_at for every test row; no test depends on the value
+_SESSION_START = datetime.now(timezone.utc)
 
 
-@pytest.fixture
-async def db_client(settings):
-    """Create a database client for testing."""
-    client = DatabaseClient(settings.database_url)
-    await client.connect()
-    yield client
-    await client.disconnect()
+# Statements run by the setup helpers (warmed on every pooled connection)
+_PROJECT_UUID_SQL = "SELECT id FROM projects WHERE slug = $1"
+_INSERT_DOCUMENT_SQL = """
+    INSERT INTO documents (id, project_id, path, content_hash, created_at, updated_at, category)
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+"""
+_INSERT_CHUNK_SQL = """
+    INSERT INTO chunks (id, document_id, project_id, content, embedding, chunk_index, metadata)
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+"""
+# Same insert with the embedding bound as halfvec (see insert_test_documents_bulk)
+_INSERT_HALFVEC_CHUNK_SQL = _INSERT_CHUNK_SQL.replace("$5,", "$5::halfvec::vector,")
 
 
-@pytest.fixture
-async def cache_client(settings):
-    """Create a Redis cache client for testing."""
-    client = RedisClient(settings.redis_url)
-    await client.connect()
-    yield client
-    await client.close()
+def _uuid_stream(batch: int = 1024):
+    """Random version-4 UUIDs, read from os.urandom ``batch`` at a time."""
+    while True:
+        buf = os.urandom(16 * batch)
+        for i in range(0, len(buf), 16):
+            yield UUID(bytes=buf[i:i + 16], version=4)
 
 
-@pytest.fixture
-def embedding_client(settings):
-    """Create an embedding client for testing."""
-    return EmbeddingClient(api_key=settings.open_ai_api)
+_uuids = _uuid_stream()
 
 
-@pytest.fixture
-async def project_id(db_client):
-    """Create a test project and return its slug."""
-    slug = f"test-e2e-{uuid.uuid4().hex[:8]}"
-    project_uuid = uuid.uuid4()
-    now = datetime.now(timezone.utc)
-    
+def _new_uuid() -> UUID:
+    """Drop-in for uuid.uuid4() without a urandom read per call."""
+    return next(_uuids)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def session_project(db_client):
+    """Create one test project for the session and return its id and slug."""
+    slug = f"test-e2e-{_new_uuid().hex[:8]}"
+    project_uuid = _new_uuid()
     await db_client.execute(
         """
         INSERT INTO projects (id, slug, name, created_at, updated_at, corpus_version)
         VALUES ($1, $2, $3, $4, $5, $6)
         """,
-        project_uuid, slug, f"Test Project {slug}", now, now, 1
+        project_uuid, slug, f"Test Project {slug}", _SESSION_START, _SESSION_START, 1
     )
     
-    yield slug
+    yield {"id": project_uuid, "slug": slug}
     
-    # Cleanup
-    await db_client.execute("DELETE FROM chunks WHERE project_id = $1", project_uuid)
-    await db_client.execute("DELETE FROM documents WHERE project_id = $1", project_uuid)
+    # Cleanup (documents and chunks cascade)
     await db_client.execute("DELETE FROM projects WHERE id = $1", project_uuid)
 
 
 @pytest.fixture
-async def search_service(db_client, cache_client, embedding_client):
-    """Create a search service with all dependencies."""
-    service = SearchService(
+def namespace() -> str:
+    """Per-test path prefix for documents in the shared project."""
+    return f"/ns-{_new_uuid().hex[:8]}"
+
+
+@pytest_asyncio.fixture
+async def project_id(db_client, session_project, namespace):
+    """Slug of the shared test project; removes this test's documents after."""
+    yield session_project["slug"]
+    
+    # Cleanup only what this test inserted (chunks cascade)
+    await db_client.execute(
+        "DELETE FROM documents WHERE project_id = $1 AND path LIKE $2 || '/%'",
+        session_project["id"],
+        namespace,
+    )
+
+
+@asynccontextmanager
+async def pooled_conn(db_client):
+    """Hold one pool connection for a test's setup helpers.
+    
+    Each db_client call acquires and releases its own connection; helpers
+    taking ``conn`` share this one (and its prepared-statement cache).
+    """
+    async with db_client._pool.acquire() as conn:
+        yield conn
+
+
+@pytest_asyncio.fixture
+async def conn(db_client):
+    """One pooled connection shared by a test's setup helpers."""
+    async with pooled_conn(db_client) as conn:
+        yield conn
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warm_statement_cache(db_client):
+    """Prepare the setup helpers' statements on each idle pool connection.
+    
+    asyncpg caches prepared statements per connection, so without this the
+    first insert on every connection pays a parse/plan round trip inside a
+    test. executemany with no rows prepares and caches without writing.
+    """
+    pool = db_client._pool
+    
+    async def warm(conn) -> None:
+        statements = [_PROJECT_UUID_SQL, _INSERT_DOCUMENT_SQL, _INSERT_CHUNK_SQL]
+        if await _supports_halfvec(conn):
+            statements.append(_INSERT_HALFVEC_CHUNK_SQL)
+        for sql in statements:
+            await conn.executemany(sql, [])
+    
+    # Hold every connection at once so each one is warmed; the stack
+    # releases whatever was acquired even if a later acquire fails
+    async with AsyncExitStack() as stack:
+        conns = [
+            await stack.enter_async_context(pool.acquire())
+            for _ in range(pool.get_idle_size())
+        ]
+        await asyncio.gather(*(warm(conn) for conn in conns))
+
+
+@pytest.fixture(scope="session")
+def search_service(db_client, cache_client, embedding_client):
+    """Create a search service with all dependencies (reranker loaded once)."""
+    return SearchService(
         db_client=db_client,
         cache_client=cache_client,
         embedding_client=embedding_client,
     )
-    yield service
 
 
-async def get_project_uuid(db_client, project_slug: str) -> UUID:
-    """Get project UUID from slug."""
-    async with db_client._pool.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT id FROM projects WHERE slug = $1",
-            project_slug
+# Test project slugs are random and never re-pointed, so slug -> UUID
+# can be memoized for the whole run
+_project_uuid_cache: dict[str, UUID] = {}
+
+
+async def get_project_uuid(conn, project_slug: str) -> UUID:
+    """Get project UUID from slug (looked up once per slug)."""
+    if project_slug not in _project_uuid_cache:
+        _project_uuid_cache[project_slug] = await conn.fetchval(
+            _PROJECT_UUID_SQL, project_slug
+        )
+    return _project_uuid_cache[project_slug]
+
+
+# Embeddings of test content, keyed by (model, text); the texts are fixed
+# strings, so each is requested from the API at most once per session
+_embedding_cache: dict[tuple[str, str], list[float]] = {}
+
+
+async def cached_embed(embedding_client, text: str) -> list[float]:
+    """Embed text, reusing an earlier result for the same model and text."""
+    [embedding] = await cached_embed_batch(embedding_client, [text])
+    return embedding
+
+
+async def cached_embed_batch(embedding_client, texts: list[str]) -> list[list[float]]:
+    """Embed texts, requesting only the ones not already cached (one batch)."""
+    model = embedding_client.model_name
+    missing = list(dict.fromkeys(t for t in texts if (model, t) not in _embedding_cache))
+    if missing:
+        embeddings = await embedding_client.embed_batch(missing)
+        _embedding_cache.update(
+            ((model, text), embedding) for text, embedding in zip(missing, embeddings, strict=True)
+        )
+    return [_embedding_cache[(model, text)] for text in texts]
+
+
+async def delete_test_project(db_client, project_uuid: UUID) -> None:
+    """Delete a test project (documents and chunks cascade)."""
+    await db_client.execute("DELETE FROM projects WHERE id = $1", project_uuid)
+
+
+def _content_hash(content: str) -> str:
+    """Hash of the document text, as ingestion would store it."""
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+def _as_vector(embedding: list[float], dtype: str = ">f4") -> np.ndarray:
+    """Embedding in the pgvector binary wire format (big-endian floats).
+    
+    The pool registers pgvector's binary codec; handing it this dtype
+    lets it send the buffer as-is instead of converting a Python list.
+    """
+    return np.asarray(embedding, dtype=dtype)
+
+
+# Whether the server's pgvector has halfvec (0.7+); checked on first use
+_halfvec_supported: bool | None = None
+
+
+async def _supports_halfvec(conn) -> bool:
+    """Whether embeddings can be sent as halfvec and cast on the server."""
+    global _halfvec_supported
+    if _halfvec_supported is None:
+        _halfvec_supported = await conn.fetchval(
+            "SELECT to_regtype('halfvec') IS NOT NULL"
         )
-        return row["id"]
+    return _halfvec_supported
+
+
+async def insert_test_documents_bulk(
+    conn,
+    project_slug: str,
+    rows: list[tuple[str, str, list[float], str]],
+    half_precision: bool = False,
+) -> list[tuple[UUID, UUID]]:
+    """Helper to insert test documents with one chunk each.
+    
+    Args:
+        rows: (path, content, embedding, category) per document
+        half_precision: Send embeddings as float16 (halfvec), halving the
+            bytes per row; only for tests that do not depend on ranking.
+            The column stays vector - the server casts on insert.
+    
+    Returns:
+        (doc_id, chunk_id) per row, in input order
+    """
+    project_uuid = await get_project_uuid(conn, project_slug)
+    if half_precision and await _supports_halfvec(conn):
+        dtype, insert_chunk_sql = ">f2", _INSERT_HALFVEC_CHUNK_SQL
+    else:
+        dtype, insert_chunk_sql = ">f4", _INSERT_CHUNK_SQL
+    ids = [(_new_uuid(), _new_uuid()) for _ in rows]
+    
+    doc_rows = [
+        (doc_id, project_uuid, path, _content_hash(content), _SESSION_START, _SESSION_START, category)
+        for (doc_id, _), (path, content, _, category) in zip(ids, rows, strict=True)
+    ]
+    chunk_rows = [
+        (chunk_id, doc_id, project_uuid, content, _as_vector(embedding, dtype), 0, _EMPTY_METADATA)
+        for (doc_id, chunk_id), (_, content, embedding, _) in zip(ids, rows, strict=True)
+    ]
+    
+    # One executemany per table: two round trips regardless of row count
+    await conn.executemany(_INSERT_DOCUMENT_SQL, doc_rows)
+    await conn.executemany(insert_chunk_sql, chunk_rows)
+    
+    return ids
 
 
 async def insert_test_document(
-    db_client,
+    conn,
     project_slug: str,
     path: str,
     content: str,
     embedding: list[float],
-    category: str = "test"
+    category: str = "test",
+    half_precision: bool = False,
 ) -> tuple[UUID, UUID]:
     """Helper to insert a test document and chunk."""
-    project_uuid = await get_project_uuid(db_client, project_slug)
-    doc_id = uuid.uuid4()
-    chunk_id = uuid.uuid4()
-    now = datetime.now(timezone.utc)
-    
-    # Insert document
-    await db_client.execute(
-        """
-        INSERT INTO documents (id, project_id, path, content_hash, created_at, updated_at, category)
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
-        """,
-        doc_id, project_uuid, path, f"hash-{doc_id.hex[:8]}", now, now, category
-    )
-    
-    # Insert chunk with embedding
-    await db_client.execute(
-        """
-        INSERT INTO chunks (id, document_id, project_id, content, embedding, chunk_index, metadata)
-        VALUES ($1, $2, $3, $4, $5, $6, $7)
-        """,
-        chunk_id, doc_id, project_uuid, content, embedding, 0, json.dumps({})
+    [ids] = await insert_test_documents_bulk(
+        conn, project_slug, [(path, content, embedding, category)], half_precision
     )
-    
-    return doc_id, chunk_id
+    return ids
 
 
-@pytest.mark.asyncio
-async def test_ingest_then_search(db_client, cache_client, embedding_client, project_id, search_service):
+async def test_ingest_then_search(conn, cache_client, embedding_client, project_id, namespace, search_service):
     """
     Test full flow: insert document with embedding, then search for it.
     
@@ -140,14 +292,14 @@ async def test_ingest_then_search(db_client, cache_client, embedding_client, pro
     """
     # 1. Generate embedding for test content
     test_content = "Python is a versatile programming language used for web development, data science, and machine learning."
-    embedding = await embedding_client.embed(test_content)
+    embedding = await cached_embed(embedding_client, test_content)
     
     # Embedding dimension depends on the model (1024 for Voyage, 1536 for OpenAI text-embedding-3-small)
     assert len(embedding) in (1024, 1536), f"Expected 1024 or 1536-dim embedding, got {len(embedding)}"
     
     # 2. Insert the document
     doc_id, chunk_id = await insert_test_document(
-        db_client, project_id, "/docs/python.md", test_content, embedding, category="docs"
+        conn, project_id, f"{namespace}/docs/python.md", test_content, embedding, category="docs"
     )
     
     # 3. Search for the content
@@ -173,8 +325,7 @@ async def test_ingest_then_search(db_client, cache_client, embedding_client, pro
     assert "Python" in our_result.content
 
 
-@pytest.mark.asyncio
-async def test_mcp_tool_call_flow(db_client, cache_client, embedding_client, project_id, search_service):
+async def test_mcp_tool_call_flow(conn, cache_client, project_id, namespace, search_service):
     """
     Test simulated MCP tool call flow.
     
@@ -190,13 +341,23 @@ async def test_mcp_tool_call_flow(db_client, cache_client, embedding_client, pro
         ("REST API endpoint documentation", "/docs/api-reference.md", "api"),
     ]
     
-    chunk_ids = []
-    for content, path, category in contents:
-        embedding = await embedding_client.embed(content)
-        _, chunk_id = await insert_test_document(
-            db_client, project_id, path, content, embedding, category
-        )
-        chunk_ids.append(chunk_id)
+    # Filter mechanics only - no semantic ranking, so no API call needed
+    embeddings = [fake_embed(content) for content, _, _ in contents]
+    
+    inserted = await insert_test_documents_bulk(
+        conn,
+        project_id,
+        [
+            (f"{namespace}{path}", content, embedding, category)
+            for (content, path, category), embedding in zip(contents, embeddings, strict=True)
+        ],
+        half_precision=True,
+    )
+    api_chunk_ids = {
+        chunk_id
+        for (_, _, category), (_, chunk_id) in zip(contents, inserted, strict=True)
+        if category == "api"
+    }
     
     # Simulate MCP tool call
     tool_args = {
@@ -216,13 +377,15 @@ async def test_mcp_tool_call_flow(db_client, cache_client, embedding_client, pro
     assert hasattr(response, "total_found")
     
     # Results should be serializable (for MCP JSON-RPC)
-    response_dict = response.model_dump(mode="json")
+    response_dict = json.loads(response.model_dump_json())
     assert isinstance(response_dict, dict)
     assert "results" in response_dict
+    
+    # Category filter: only the API docs inserted above come back
+    assert {result.id for result in response.results} <= api_chunk_ids
 
 
-@pytest.mark.asyncio
-async def test_cache_invalidation_on_ingest(db_client, cache_client, embedding_client, project_id, search_service):
+async def test_cache_invalidation_on_ingest(conn, cache_client, embedding_client, project_id, namespace, search_service):
     """
     Test that cache is invalidated when new documents are ingested.
     
@@ -230,14 +393,20 @@ async def test_cache_invalidation_on_ingest(db_client, cache_client, embedding_c
     1. Insert document A
     2. Search (cache miss, stores result)
     3. Search again (cache hit)
-    4. Insert document B (should invalidate cache)
-    5. Search again (cache miss, includes B)
+    4. Insert document B
+    5. Invalidate the project cache; the entry from step 3 is gone
     """
-    # 1. Insert first document
     content_a = "FastAPI is a modern Python web framework"
-    embedding_a = await embedding_client.embed(content_a)
+    content_b = "Flask is a lightweight Python web framework"
+    
+    # Embed both documents up front, in one request
+    embedding_a, embedding_b = await cached_embed_batch(
+        embedding_client, [content_a, content_b]
+    )
+    
+    # 1. Insert first document
     _, chunk_id_a = await insert_test_document(
-        db_client, project_id, "/docs/fastapi.md", content_a, embedding_a
+        conn, project_id, f"{namespace}/docs/fastapi.md", content_a, embedding_a
     )
     
     # 2. First search (cache miss)
@@ -255,68 +424,65 @@ async def test_cache_invalidation_on_ingest(db_client, cache_client, embedding_c
     assert len(response2.results) >= 1
     assert response2.cache_hit is True
     
+    cached_key = generate_cache_key(
+        project_id=project_id,
+        corpus_version=response2.corpus_version,
+        query=request.query,
+        top_k=request.top_k,
+        category=request.category,
+        use_reranker=request.use_reranker,
+    )
+    assert await cache_client.get(cached_key) is not None
+    
     # 4. Insert new document
-    content_b = "Flask is a lightweight Python web framework"
-    embedding_b = await embedding_client.embed(content_b)
     _, chunk_id_b = await insert_test_document(
-        db_client, project_id, "/docs/flask.md", content_b, embedding_b
+        conn, project_id, f"{namespace}/docs/flask.md", content_b, embedding_b
     )
     
     # 5. Invalidate cache for this project
     await cache_client.invalidate_project(project_id)
     
-    # 6. Third search (cache miss, should include new document)
-    response3 = await search_service.search(request)
-    
-    # Should be cache miss after invalidation
-    assert response3.cache_hit is False
-    # Both documents should potentially be in results
-    assert len(response3.results) >= 1
+    # The entry served in step 3 is gone - checked directly, no search needed
+    assert await cache_client.get(cached_key) is None
 
 
-@pytest.mark.asyncio
-async def test_multi_tenant_isolation(db_client, cache_client, embedding_client, search_service):
+async def test_multi_tenant_isolation(db_client, conn, cache_client, search_service):
     """
     Test that projects are properly isolated.
     
     Documents from project A should not appear in project B's search results.
     """
-    now = datetime.now(timezone.utc)
-    
-    # Create two test projects
-    project_a_slug = f"test-tenant-a-{uuid.uuid4().hex[:8]}"
-    project_a_uuid = uuid.uuid4()
-    await db_client.execute(
-        """
-        INSERT INTO projects (id, slug, name, created_at, updated_at, corpus_version)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        """,
-        project_a_uuid, project_a_slug, "Project A", now, now, 1
-    )
-    
-    project_b_slug = f"test-tenant-b-{uuid.uuid4().hex[:8]}"
-    project_b_uuid = uuid.uuid4()
-    await db_client.execute(
+    # Create two test projects (one multi-row INSERT)
+    project_a_slug = f"test-tenant-a-{_new_uuid().hex[:8]}"
+    project_a_uuid = _new_uuid()
+    project_b_slug = f"test-tenant-b-{_new_uuid().hex[:8]}"
+    project_b_uuid = _new_uuid()
+    await conn.execute(
         """
         INSERT INTO projects (id, slug, name, created_at, updated_at, corpus_version)
-        VALUES ($1, $2, $3, $4, $5, $6)
+        VALUES ($1, $2, $3, $7, $7, 1), ($4, $5, $6, $7, $7, 1)
         """,
-        project_b_uuid, project_b_slug, "Project B", now, now, 1
+        project_a_uuid, project_a_slug, "Project A",
+        project_b_uuid, project_b_slug, "Project B",
+        _SESSION_START,
     )
     
     try:
-        # Insert document in project A
         content_a = "Secret document for project A only"
-        embedding_a = await embedding_client.embed(content_a)
+        content_b = "Public document for project B"
+        # Isolation is a WHERE clause, not ranking - pseudo-embeddings suffice
+        embedding_a, embedding_b = fake_embed(content_a), fake_embed(content_b)
+        
+        # Insert document in project A
         _, chunk_id_a = await insert_test_document(
-            db_client, project_a_slug, "/secret/a.md", content_a, embedding_a
+            conn, project_a_slug, "/secret/a.md", content_a, embedding_a,
+            half_precision=True,
         )
         
         # Insert document in project B
-        content_b = "Public document for project B"
-        embedding_b = await embedding_client.embed(content_b)
         _, chunk_id_b = await insert_test_document(
-            db_client, project_b_slug, "/public/b.md", content_b, embedding_b
+            conn, project_b_slug, "/public/b.md", content_b, embedding_b,
+            half_precision=True,
         )
         
         # Search in project A
@@ -344,11 +510,8 @@ async def test_multi_tenant_isolation(db_client, cache_client, embedding_client,
         assert chunk_id_a not in result_ids_b, "Project B should not see project A's documents"
         
     finally:
-        # Cleanup
-        await db_client.execute("DELETE FROM chunks WHERE project_id = $1", project_a_uuid)
-        await db_client.execute("DELETE FROM documents WHERE project_id = $1", project_a_uuid)
-        await db_client.execute("DELETE FROM projects WHERE id = $1", project_a_uuid)
-        
-        await db_client.execute("DELETE FROM chunks WHERE project_id = $1", project_b_uuid)
-        await db_client.execute("DELETE FROM documents WHERE project_id = $1", project_b_uuid)
-        await db_client.execute("DELETE FROM projects WHERE id = $1", project_b_uuid)
+        # Cleanup - the two projects are independent, so delete them concurrently
+        await asyncio.gather(
+            delete_test_project(db_client, project_a_uuid),
+            delete_test_project(db_client, project_b_uuid),
+        )